@@ -2,12 +2,13 @@
 """
 # Basic packages
 import json
-import pandas as pd
+from functools import cached_property
 import numpy as np
+from numba import njit
 
 # Gynasium packages
 from gymnasium.utils import seeding
-from gymnasium.spaces import Dict, Box
+from gymnasium.vector.utils import batch_space
 from pettingzoo import AECEnv
 from pettingzoo.utils import agent_selector, wrappers
 from pettingzoo.utils.conversions import parallel_wrapper_fn
@@ -22,6 +23,539 @@ except ModuleNotFoundError:
     from utils.spaces import ObsSpace, ActSpace
 
 
+@njit(cache=True, fastmath=True)
+def _step_kernel(step_count, rewards, terminations, truncations,
+                 eps_end_timestep, actions):
+    """Advances the batched state of every copy by one step, in place.
+    Compiled with Numba so the whole batch is stepped in a single loop
+    outside of the interpreter.
+
+    Args:
+        step_count (np.ndarray): Steps taken by each copy, int32.
+        rewards (np.ndarray): Reward of each copy, float32.
+        terminations (np.ndarray): Whether each copy has terminated.
+        truncations (np.ndarray): Whether each copy has been truncated.
+        eps_end_timestep (int): Number of steps in an episode.
+        actions (np.ndarray): Action of each copy, int64.
+    """
+    for i in range(step_count.shape[0]):
+        # Step incremented regardless of whether a staff is moved or not
+        step_count[i] += 1
+
+        # You will need a set of code to handle the movement
+        # This is not shown here as it is too complex but essentially
+        # this is how your agents interact with your custom sim env
+
+        # Update rewards
+        rewards[i] = 1.0
+
+        # Episode completion conditions
+        if step_count[i] % eps_end_timestep == 0:
+            terminations[i] = True
+
+
+def _load_cuda_kernels():
+    """Imports the CUDA kernels, only done when the cuda device is
+    requested as importing `numba.cuda` is slow.
+
+    Returns:
+        module: The `cuda_kernels` module.
+    """
+    try:
+        # Custom packages via pip
+        from rlhr_sim.simulator.utils import cuda_kernels
+    except ModuleNotFoundError:
+        # Custom packages via path-based import
+        from utils import cuda_kernels
+
+    return cuda_kernels
+
+
+class CustomVectorEnv:
+    """Batched version of the custom simulator. Rather than stepping a
+    single copy of the environment at a time, the state of `num_envs`
+    parallel copies is held as NumPy arrays of shape `(num_envs, ...)`
+    and every copy is stepped in a single vectorized pass.
+
+    The API is modelled on gymnasium's `VectorEnv`: `reset` and `step` take
+    and return batched arrays with one row per copy. Unlike `VectorEnv`,
+    `step` does not reset the copies whose episode ended, they keep being
+    stepped, with their terminations left set, until `reset` is called. Use
+    `step_batch` to have finished copies reset automatically. `CustomEnv`
+    below is a thin AEC shim over a single copy of this class, which is
+    what RLSuite interacts with.
+
+    With `device="cuda"`, the state and observations live on the GPU as
+    Numba device arrays and every copy is stepped by its own GPU thread, so
+    the trainer can consume them without a round trip to the CPU. This is
+    only worth it for large batches, e.g. `num_envs` in the tens of
+    thousands. Observations, and the observation spaces, are then float32,
+    as that is what the GPU random number generator draws. The rewards,
+    terminations and truncations returned by `step` and `step_batch` are
+    then preallocated device arrays too, only valid until the next call.
+
+    Read more about vectorized environments here:
+    - https://gymnasium.farama.org/api/vector/
+    """
+
+    # Default parameter
+    metadata = {"render_modes": ["ansi", "human"]}
+
+    def __init__(self,
+                 max_action_space_size:int,
+                 eps_end_timestep:int,
+                 num_envs:int=1,
+                 render_mode="ansi",
+                 device:str="cpu",
+                 **kwargs
+                 ):
+        """
+        Initializes the CustomVectorEnv class.
+        """
+        if device not in ("cpu", "cuda"):
+            raise ValueError(f"Unknown device {device}, expected 'cpu' or 'cuda'")
+        if device == "cuda":
+            self._gpu = _load_cuda_kernels()
+            if not self._gpu.cuda.is_available():
+                raise RuntimeError("The cuda device was requested but no GPU is available")
+
+        self.num_envs = num_envs
+        self.eps_end_timestep = eps_end_timestep
+        self.max_action_space_size = max_action_space_size
+        self.render_mode = render_mode
+        self.device = device
+        self.kwargs = kwargs
+
+        # The GPU random number generator draws float32, so the observations
+        # and their space are float32 on the cuda device
+        self._obs_dtype = np.float32 if device == "cuda" else np.float16
+
+        # Batched state, one entry per parallel copy
+        self.step_count = np.zeros(num_envs, dtype=np.int32)
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminations = np.zeros(num_envs, dtype=bool)
+        self.truncations = np.zeros(num_envs, dtype=bool)
+
+        if device == "cuda":
+            self._init_cuda()
+            return
+
+        # Compile the step kernel now so the first step doesn't pay for it
+        _step_kernel(
+            np.zeros(1, dtype=np.int32),
+            np.zeros(1, dtype=np.float32),
+            np.zeros(1, dtype=bool),
+            np.zeros(1, dtype=bool),
+            eps_end_timestep,
+            np.zeros(1, dtype=np.int64)
+        )
+
+        # Seed variable - Compulsory to be set
+        self._seed()
+
+        # Observation buffers, filled in place on every observation. Each
+        # field is a contiguous view into a single float16 block, so the
+        # whole observation is drawn and cast in one go
+        obs_size = num_envs * (97 + max_action_space_size * 9)
+        self._obs_f16 = np.empty(obs_size, np.float16)
+        self._view_buffers()
+
+        # The action mask is computed from the state rather than drawn, see
+        # `_compute_action_mask`
+        self._action_mask = np.ones((num_envs, max_action_space_size), np.float16)
+
+        # The RNG only draws float32 and above, so it draws into a persistent
+        # float32 scratch which is then cast into the block in place
+        self._obs_f32 = np.empty_like(self._obs_f16, dtype=np.float32)
+
+        # Observation handed out on every call, only the buffers behind it
+        # change between calls
+        self._obs_template = self._pack(slice(None))
+
+    def _view_buffers(self):
+        """Sets the observation buffers as views into the float16 block."""
+        num_envs = self.num_envs
+        max_action_space_size = self.max_action_space_size
+        pos_size = num_envs * 97
+        staff_size = num_envs * max_action_space_size * 5
+
+        self._pos_buf = self._obs_f16[:pos_size].reshape(num_envs, 97)
+        self._staff_buf = self._obs_f16[pos_size:pos_size + staff_size].reshape(
+            num_envs, max_action_space_size, 5
+        )
+        self._staff_vec_buf = self._obs_f16[pos_size + staff_size:].reshape(
+            num_envs, max_action_space_size, 4
+        )
+
+    def __getstate__(self):
+        # Pickling and deepcopy copy views apart from the block they view,
+        # so they are dropped, along with the observation template holding
+        # them, and set again from the copied block. Modules can't be
+        # pickled, the kernels are imported again instead
+        state = self.__dict__.copy()
+        del state["_obs_template"]
+        state.pop("_gpu", None)
+        if self.device == "cpu":
+            for key in ("_pos_buf", "_staff_buf", "_staff_vec_buf"):
+                del state[key]
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.device == "cuda":
+            self._gpu = _load_cuda_kernels()
+        else:
+            self._view_buffers()
+
+        self._obs_template = self._pack(slice(None))
+
+    def _init_cuda(self):
+        """Moves the batched state to the GPU and allocates the observation
+        and output buffers there, so stepping allocates nothing.
+        """
+        cuda = self._gpu.cuda
+        num_envs = self.num_envs
+        max_action_space_size = self.max_action_space_size
+        self._threads = self._gpu.THREADS_PER_BLOCK
+        self._blocks = (num_envs + self._threads - 1) // self._threads
+
+        self.step_count = cuda.to_device(self.step_count)
+        self.rewards = cuda.to_device(self.rewards)
+        self.terminations = cuda.to_device(self.terminations)
+        self.truncations = cuda.to_device(self.truncations)
+
+        # Seed variable - Compulsory to be set
+        self._seed()
+
+        # Observation buffers, filled in place on the GPU
+        self._pos_buf = cuda.device_array((num_envs, 97), self._obs_dtype)
+        self._staff_buf = cuda.device_array((num_envs, max_action_space_size, 5), self._obs_dtype)
+        self._staff_vec_buf = cuda.device_array((num_envs, max_action_space_size, 4), self._obs_dtype)
+        self._action_mask = cuda.to_device(
+            np.ones((num_envs, max_action_space_size), self._obs_dtype)
+        )
+
+        # Buffers the results of a step are copied out to
+        self._rewards_out = cuda.device_array_like(self.rewards)
+        self._terminations_out = cuda.device_array_like(self.terminations)
+        self._truncations_out = cuda.device_array_like(self.truncations)
+
+        # Actions given on the host are copied into this buffer
+        self._actions_buf = cuda.device_array(num_envs, np.int64)
+
+        # Selects every copy, used when the whole batch is reset
+        self._reset_all = cuda.to_device(np.ones(num_envs, dtype=bool))
+
+        # Observation handed out on every call, only the buffers behind it
+        # change between calls
+        self._obs_template = self._pack(slice(None))
+
+    def _seed(self, seed=None):
+        np_random, seed = seeding.np_random(seed)
+        self._set_rng(np_random)
+
+    def _set_rng(self, np_random):
+        """Sets the generator the observations are drawn from.
+
+        Args:
+            np_random (np.random.Generator): The generator to draw from.
+        """
+        self.np_random = np_random
+
+        # Generator used for the bulk observation fills. Gymnasium's seeding
+        # already returns a PCG64 `np.random.Generator`, so it is shared
+        # rather than seeding a second, identical stream. Every copy draws
+        # from this one generator, the whole batch being filled in a single
+        # call
+        self._rng = self.np_random
+
+        if self.device == "cuda":
+            # One random stream per GPU thread, seeded from the generator
+            self._rng_states = self._gpu.create_xoroshiro128p_states(
+                self.num_envs, seed=int(self._rng.integers(2**63))
+            )
+
+    # The spaces are only built when first queried, as trainers often only
+    # need them once to read their shapes
+    @cached_property
+    def single_observation_space(self):
+        """Observation space of a single copy. The space is cached and shared
+        by every environment of the same size, don't seed it, seed a
+        `deepcopy` of it instead."""
+        return ObsSpace.create(
+            max_action_space_size=self.max_action_space_size,
+            dtype=self._obs_dtype
+        )
+
+    @cached_property
+    def single_action_space(self):
+        """Action space of a single copy. Shared like the observation space,
+        don't seed it, seed a `deepcopy` of it instead."""
+        return ActSpace.create(max_action_space_size=self.max_action_space_size)
+
+    @cached_property
+    def observation_space(self):
+        """Observation space of the whole batch."""
+        return batch_space(self.single_observation_space, n=self.num_envs)
+
+    @cached_property
+    def action_space(self):
+        """Action space of the whole batch."""
+        return batch_space(self.single_action_space, n=self.num_envs)
+
+    def _fill(self):
+        """Draws a fresh observation of every copy into the buffers. This
+        replaces `observation_space.sample()`, which walks every nested
+        `Box` of the space in Python.
+        """
+        if self.device == "cuda":
+            self._gpu.fill_gpu[self._blocks, self._threads](
+                self._rng_states,
+                self._pos_buf,
+                self._staff_buf,
+                self._staff_vec_buf
+            )
+            return
+
+        self._rng.random(dtype=np.float32, out=self._obs_f32)
+        np.copyto(self._obs_f16, self._obs_f32, casting="unsafe")
+
+    def _pack(self, index) -> dict:
+        """Packs views of the buffers into the structure of the observation
+        space.
+
+        Args:
+            index (int | slice): The copy to pack, or `slice(None)` to pack
+                                 the whole batch.
+
+        Returns:
+            obs (dict): The observation referencing the buffers.
+        """
+        staff_details = {
+            "scalars": self._staff_buf[index],
+            "vec": self._staff_vec_buf[index]
+        }
+
+        return {
+            "observation": {
+                "position_details": self._pos_buf[index],
+                "staff_details": staff_details
+            },
+            "action_mask": self._action_mask[index]
+        }
+
+    def _compute_action_mask(self):
+        """Updates the action mask of every copy in place, where 1 marks a
+        staff that can be moved and 0 one that cannot.
+        """
+        # You will need a set of code to work out which staff are eligible
+        # to be moved given the current state. This is not shown here, so
+        # every staff is left as eligible
+        if self.device == "cuda":
+            # The mask is allocated as ones on the GPU and never changes
+            return
+
+        self._action_mask[...] = 1
+
+    def _observe(self) -> dict:
+        """Returns the batched observation of every copy. The same dict,
+        backed by the same buffers, is returned on every call, so it is only
+        valid until the next observation. Copy it to keep it around.
+
+        Returns:
+            obs (dict): The observations, with a leading `num_envs` axis on
+                        every leaf array.
+        """
+        self._fill()
+
+        return self._obs_template
+
+    def _reset_state(self, mask=slice(None)):
+        """Resets the batched state in place.
+
+        Args:
+            mask (np.ndarray | slice): Boolean array of shape `(num_envs,)`
+                                       selecting the copies to reset.
+                                       Defaults to every copy.
+        """
+        if self.device == "cuda":
+            if isinstance(mask, slice) and mask == slice(None):
+                selected = self._reset_all
+            else:
+                selected = np.zeros(self.num_envs, dtype=bool)
+                selected[mask] = True
+                selected = self._gpu.cuda.to_device(selected)
+
+            self._gpu.reset_gpu[self._blocks, self._threads](
+                self.step_count,
+                self.rewards,
+                self.terminations,
+                self.truncations,
+                selected
+            )
+            self._compute_action_mask()
+            return
+
+        self.step_count[mask] = 0
+        self.rewards[mask] = 0
+        self.terminations[mask] = False
+        self.truncations[mask] = False
+        self._compute_action_mask()
+
+    def _step_state(self, actions:np.ndarray):
+        """Advances the batched state of every copy by one step.
+
+        Args:
+            actions (np.ndarray): Integer array of shape `(num_envs,)`, one
+                                  action per copy.
+
+        Raises:
+            ValueError: If `actions` is not of shape `(num_envs,)`.
+        """
+        if not hasattr(actions, "shape"):
+            actions = np.asarray(actions)
+        if actions.shape != (self.num_envs, ):
+            raise ValueError(
+                f"Expected actions of shape ({self.num_envs},), got {actions.shape}"
+            )
+
+        if self.device == "cuda":
+            if not self._gpu.cuda.is_cuda_array(actions):
+                self._actions_buf.copy_to_device(
+                    np.ascontiguousarray(actions, dtype=np.int64)
+                )
+                actions = self._actions_buf
+
+            self._gpu.step_gpu[self._blocks, self._threads](
+                self.step_count,
+                self.rewards,
+                self.terminations,
+                self.eps_end_timestep,
+                actions
+            )
+            self._compute_action_mask()
+            return
+
+        _step_kernel(
+            self.step_count,
+            self.rewards,
+            self.terminations,
+            self.truncations,
+            self.eps_end_timestep,
+            np.asarray(actions, dtype=np.int64)
+        )
+        self._compute_action_mask()
+
+    def _copy_out(self):
+        """Copies out the rewards, terminations and truncations of the last
+        step. On the cuda device they are copied into the preallocated
+        output buffers rather than into new arrays.
+
+        Returns:
+            tuple: The rewards, terminations and truncations.
+        """
+        if self.device == "cuda":
+            self._rewards_out.copy_to_device(self.rewards)
+            self._terminations_out.copy_to_device(self.terminations)
+            self._truncations_out.copy_to_device(self.truncations)
+            return self._rewards_out, self._terminations_out, self._truncations_out
+
+        return self.rewards.copy(), self.terminations.copy(), self.truncations.copy()
+
+    def reset(self, seed=None, options=None):
+        """Resets every copy of the environment.
+
+        Args:
+            seed (int): Seed for the random number generator. Defaults to None.
+            options (dict): Unused, kept for API compliance. Defaults to None.
+
+        Returns:
+            obs (dict): The batched observation of every copy, only valid
+                        until the next call to `reset` or `step`.
+            infos (dict): Additional information about every copy.
+        """
+        if seed is not None:
+            self._seed(seed=seed)
+
+        self._reset_state()
+
+        return self._observe(), {}
+
+    def step(self, actions):
+        """Takes and executes one action per copy of the environment. Copies
+        whose episode has ended are not reset, call `reset` or use
+        `step_batch` instead.
+
+        Args:
+            actions (np.ndarray): Integer array of shape `(num_envs,)`, each
+                                  between 0 and `max_action_space_size - 1`.
+
+        Returns:
+            obs (dict): The batched observation of every copy, only valid
+                        until the next call to `reset` or `step`.
+            rewards (np.ndarray): The reward of every copy.
+            terminations (np.ndarray): Whether each copy has terminated.
+            truncations (np.ndarray): Whether each copy has been truncated.
+            infos (dict): Additional information about every copy.
+        """
+        self._step_state(actions)
+        rewards, terminations, truncations = self._copy_out()
+
+        return self._observe(), rewards, terminations, truncations, {}
+
+    def step_batch(self, actions):
+        """Same as `step`, except that the copies whose episode ended are
+        reset straight away, so the caller never has to call `reset`.
+        Wrappers driving the environment through `step_batch` can skip their
+        own reset of finished copies, i.e. treat it as `_skip_maybe_reset`.
+        This does not hold for `step`, which never resets.
+
+        Args:
+            actions (np.ndarray): Integer array of shape `(num_envs,)`, each
+                                  between 0 and `max_action_space_size - 1`.
+
+        Returns:
+            obs (dict): The batched observation of every copy, only valid
+                        until the next call to `reset` or `step`. Copies that
+                        were reset already hold their first observation.
+            rewards (np.ndarray): The reward of every copy.
+            terminations (np.ndarray): Whether each copy terminated on this
+                                       step.
+            truncations (np.ndarray): Whether each copy was truncated on
+                                      this step.
+            infos (dict): Additional information about every copy.
+        """
+        self._step_state(actions)
+
+        if self.device == "cuda":
+            rewards = self._rewards_out
+            terminations = self._terminations_out
+            truncations = self._truncations_out
+            self._gpu.autoreset_gpu[self._blocks, self._threads](
+                self.step_count,
+                self.rewards,
+                self.terminations,
+                self.truncations,
+                rewards,
+                terminations,
+                truncations
+            )
+            self._compute_action_mask()
+
+            return self._observe(), rewards, terminations, truncations, {}
+
+        rewards = self.rewards.copy()
+        terminations = self.terminations.copy()
+        truncations = self.truncations.copy()
+
+        done = terminations | truncations
+        if done.any():
+            self._reset_state(done)
+
+        return self._observe(), rewards, terminations, truncations, {}
+
+
 class CustomEnv(AECEnv):
     """Creates a custom PettingZoo environment. In this scenario, we
     are simulating a custom use case where we want to use RL to move
@@ -33,7 +567,9 @@ class CustomEnv(AECEnv):
     you should be able to create your own custom simulator. 
 
     While we have chosen to use an AEC environment here, under the hood, 
-    RLSuite wraps all environments as a Parellel environment. 
+    RLSuite wraps all environments as a Parellel environment. The state of
+    the simulator itself lives in a single-copy `CustomVectorEnv`, this
+    class only handles the AEC bookkeeping around it.
 
     Read more about how to choose between AEC and Parellel environments
     here:
@@ -58,52 +594,102 @@ class CustomEnv(AECEnv):
         """
         super().__init__()
 
-        # Custom data
-        # You will need an actual dataframe or any relevant object
-        self.staff_data = pd.DataFrame(
-            data={"staff_id":["abc123" for _ in range(10)]}
-        )
-        self.step_count = 0
+        # The AEC API hands observations out on the host, use
+        # `CustomVectorEnv` directly to run on the GPU
+        if kwargs.get("device", "cpu") != "cpu":
+            raise ValueError("CustomEnv only runs on the cpu device, use CustomVectorEnv for cuda")
+
+        # The AEC API steps a single copy, use `CustomVectorEnv` to batch them
+        num_envs = kwargs.pop("num_envs", 1)
+        if num_envs != 1:
+            raise ValueError(f"CustomEnv runs a single copy, got num_envs={num_envs}, use CustomVectorEnv to batch copies")
+
         self.eps_end_timestep = eps_end_timestep
         self.max_action_space_size = max_action_space_size
         self.kwargs = kwargs
 
+        # Batched simulator holding the state of this single copy
+        self._core = CustomVectorEnv(
+            max_action_space_size=max_action_space_size,
+            eps_end_timestep=eps_end_timestep,
+            num_envs=1,
+            render_mode=render_mode,
+            **kwargs
+        )
+
         # Global variables for PZ environment compliance
         self.agents = [agent]
         self.possible_agents = self.agents[:]
+        self._only_agent = agent
         self.rewards = {i: 0 for i in self.agents}
+        self._cumulative_rewards = {i: 0 for i in self.agents}
         self.terminations = {i: False for i in self.agents}
         self.truncations = {i: False for i in self.agents}
         self.infos = {i: {} for i in self.agents}
+        # The selector is kept for API compliance, but as there is a single
+        # agent it is always the one selected
         self._agent_selector = agent_selector(self.agents)
-        self.agent_selection = self._agent_selector.reset()
+        self.agent_selection = self._only_agent
         self.render_mode = render_mode
 
+        # Progress is only printed when rendering for humans, printing on
+        # every step is costly at high step rates
+        self._verbose = (render_mode == "human")
+
         # Seed variable - Compulsory to be set
         self._seed()
 
-        # Create the default observation space
-        self.observation_spaces = {
-                    i: Dict({
-                        "observation":Dict({
-                            "position_details":ObsSpace.create_pos_details(),
-                            "staff_details":ObsSpace.create_staff_details(max_staff_limit=self.max_action_space_size)
-                            }),
-                        "action_mask":Box(low=0, high=1, shape=(self.max_action_space_size, ), dtype=np.float16)
-                        })
-                    for i in self.agents
-                }
-
-        # Create the default action space
-        self.action_spaces = {
-            i: ActSpace.create(max_action_space_size=self.max_action_space_size)
-            for i in self.agents
-        }
+        # Observation of this single copy, backed by the simulator's buffers
+        self._obs_template = self._core._pack(0)
+
+    def __getstate__(self):
+        # The observation template views the simulator's buffers, it is
+        # packed again from the copied simulator, see `CustomVectorEnv`
+        state = self.__dict__.copy()
+        del state["_obs_template"]
+
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._obs_template = self._core._pack(0)
 
     def _seed(self, seed=None):
         # This is a default function, don't change it
         self.np_random, seed = seeding.np_random(seed)
 
+        # The batched simulator draws from the same generator
+        self._core._set_rng(self.np_random)
+
+    @cached_property
+    def staff_data(self):
+        """Custom data, only loaded when first used so creating an
+        environment doesn't pay for pandas or the data itself.
+        """
+        import pandas as pd
+
+        # You will need an actual dataframe or any relevant object
+        return pd.DataFrame(
+            data={"staff_id":["abc123" for _ in range(10)]}
+        )
+
+    @property
+    def step_count(self) -> int:
+        """Number of steps taken in the current episode."""
+        return int(self._core.step_count[0])
+
+    @property
+    def observation_spaces(self) -> dict:
+        """Observation space of every agent, kept for callers still using
+        the deprecated PettingZoo attribute."""
+        return {i: self.observation_space(i) for i in self.possible_agents}
+
+    @property
+    def action_spaces(self) -> dict:
+        """Action space of every agent, kept for callers still using the
+        deprecated PettingZoo attribute."""
+        return {i: self.action_space(i) for i in self.possible_agents}
+
     def observation_space(self, agent) -> dict:
         """Creates the base observation space in which the agent will
         function in.
@@ -114,8 +700,15 @@ class CustomEnv(AECEnv):
         Returns:
             obs_space (dict): The base observation space represented as a
                               dictionary object.
+
+        Raises:
+            KeyError: If `agent` is not one of the possible agents.
         """
-        return self.observation_spaces[agent]
+        if agent not in self.possible_agents:
+            raise KeyError(agent)
+
+        # Only created on first query, see `CustomVectorEnv`
+        return self._core.single_observation_space
 
     def action_space(self, agent) -> dict:
         """Set of all possible actions in an environment
@@ -129,13 +722,21 @@ class CustomEnv(AECEnv):
                               can take at any point in time is to move a
                               limited to the maximum number of staff that
                               we will consider at any given point in time.
+
+        Raises:
+            KeyError: If `agent` is not one of the possible agents.
         """
+        if agent not in self.possible_agents:
+            raise KeyError(agent)
 
-        return self.action_spaces[agent]
+        # Only created on first query, see `CustomVectorEnv`
+        return self._core.single_action_space
 
     #@profile
     def observe(self, agent) -> dict:
-        """Returns a single observation by the agent
+        """Returns a single observation by the agent. The same dict is
+        returned on every call with its arrays overwritten in place, so it
+        is only valid until the next call to `observe`.
 
         Args:
             agent (str): Name of the agent which must be a string object
@@ -145,9 +746,9 @@ class CustomEnv(AECEnv):
             obs (dict): The observation of the agent
         """
 
-        obs = self.observation_space(agent=agent).sample()
+        self._core._fill()
 
-        return obs
+        return self._obs_template
 
     #@profile
     def step(self, action):
@@ -161,34 +762,49 @@ class CustomEnv(AECEnv):
 
         # If truncation condition is met, the run will end & env will reset
         if (
-            self.terminations[self.agent_selection]
-            or self.truncations[self.agent_selection]
+            self.terminations[self._only_agent]
+            or self.truncations[self._only_agent]
             or action is None
         ):
             return self._was_dead_step(action)
 
         # Step incremented regardless of whether a staff is moved or not
-        self.step_count += 1
-        self._clear_rewards()
-        print(f"Step count: {self.step_count}", flush=True)
-
-        # You will need a set of code to handle the movement
-        # This is not shown here as it is too complex but essentially
-        # this is how your agent interacts with your custom sim env
-        
-        # Update rewards
-        self.rewards[self.agents[0]] += 1
-
-        if self.step_count % self.eps_end_timestep == 0:
-            print("End of episode.", flush=True)
+        # The movement itself is handled by the batched simulator
+        self._core._step_state(np.asarray([action]))
+        if self._verbose:
+            print(f"Step count: {self.step_count}", flush=True)
+
+        # Update rewards. With a single agent, clearing then accumulating
+        # the rewards reduces to setting them directly
+        reward = float(self._core.rewards[0])
+        self.rewards[self._only_agent] = reward
+        self._cumulative_rewards[self._only_agent] = reward
+
+        if self._core.terminations[0]:
+            if self._verbose:
+                print("End of episode.", flush=True)
             infos_dictionary = {}
-            self.infos = {i: infos_dictionary for i in self.agents}
 
             # Episode completion conditions
-            self.terminations = {i: True for i in self.agents}
+            for i in self.agents:
+                self.infos[i] = infos_dictionary
+                self.terminations[i] = True
+
+    def step_batch(self, actions):
+        """Steps the simulator directly with the episode resetting itself
+        once it ends, see `CustomVectorEnv.step_batch`. This skips the AEC
+        bookkeeping, so the rewards, terminations, truncations and infos
+        dicts are not updated, and is meant for trusted callers that don't
+        go through `step` and `last`.
 
-        self._cumulative_rewards[self.agent_selection] = 0
-        self._accumulate_rewards()
+        Args:
+            actions (np.ndarray): Integer array of shape `(1,)`.
+
+        Returns:
+            tuple: The batched observation, rewards, terminations,
+                   truncations and infos of the copy.
+        """
+        return self._core.step_batch(actions)
 
     #@profile
     def reset(self, seed=None, options=None):
@@ -198,26 +814,33 @@ class CustomEnv(AECEnv):
         if seed is not None:
             self._seed(seed=seed)
 
-        # PZ variables to reset
+        # PZ variables to reset, zeroed in place rather than rebuilt. Keys
+        # of agents removed by `_was_dead_step` are added back here
         self.agents = self.possible_agents[:]
-        self.rewards = {i: 0 for i in self.agents}
-        self._cumulative_rewards = {i: 0 for i in self.agents}
-        self.terminations = {i: False for i in self.agents}
-        self.truncations = {i: False for i in self.agents}
-        self.infos = {i: {} for i in self.agents}
+        for i in self.agents:
+            self.rewards[i] = 0
+            self._cumulative_rewards[i] = 0
+            self.terminations[i] = False
+            self.truncations[i] = False
+            self.infos.setdefault(i, {}).clear()
 
         # Reselect agent - PZ compliance requirement
-        self._agent_selector.reinit(self.agents)
-        self.agent_selection = self._agent_selector.reset()
+        self.agent_selection = self._only_agent
 
         # Custom variable to reset
-        self.step_count = 0
+        self._core._reset_state()
 
 
 def make_env(raw_env):
     """
     Wraps the raw simulator environment up for RLSuite to interface.
 
+    The returned function accepts a `validate` keyword, defaulting to True.
+    Passing `validate=False` skips the validation wrappers, which removes
+    the action range assertions and the call order enforcement from every
+    step. Only do so when the actions come from a trusted source, e.g. the
+    agent during training.
+
     Args:
         raw_env (object): The raw simulator environment.
 
@@ -227,16 +850,19 @@ def make_env(raw_env):
 
     def env(**kwargs):
 
+        validate = kwargs.pop("validate", True)
         env = raw_env(**kwargs)
 
-        # this wrapper helps error handling for discrete action spaces
-        env = wrappers.AssertOutOfBoundsWrapper(env)
-        # Provides a wide vareity of helpful user errors
-        # Strongly recommended
-        env = wrappers.OrderEnforcingWrapper(env)
+        if validate:
+            # this wrapper helps error handling for discrete action spaces
+            env = wrappers.AssertOutOfBoundsWrapper(env)
+            # Provides a wide vareity of helpful user errors
+            # Strongly recommended
+            env = wrappers.OrderEnforcingWrapper(env)
         return env
 
     return env
 
 env = make_env(CustomEnv)
 parallel_env = parallel_wrapper_fn(env)
+vector_env = CustomVectorEnv
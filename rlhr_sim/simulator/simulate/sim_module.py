@@ -9,6 +9,6 @@ path = Path(myDir)
 a=str(path.parent.absolute())
 sys.path.append(a)
 
-from .rlhr_env import env
+from .rlhr_env import env, vector_env
 
-__all__ = ["env"]
\ No newline at end of file
+__all__ = ["env", "vector_env"]
\ No newline at end of file
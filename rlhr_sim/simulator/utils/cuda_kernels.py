@@ -0,0 +1,76 @@
+"""CUDA kernels of the batched simulator, used by `CustomVectorEnv` when
+it runs on the cuda device. Kept in their own module so that importing the
+environment on a CPU-only worker doesn't import `numba.cuda`.
+"""
+
+from numba import cuda
+from numba.cuda.random import (
+    create_xoroshiro128p_states,
+    xoroshiro128p_uniform_float32
+)
+
+
+# Number of GPU threads per block, each thread handles one copy
+THREADS_PER_BLOCK = 128
+
+
+@cuda.jit
+def step_gpu(step_count, rewards, terminations, eps_end_timestep, actions):
+    """Same as `rlhr_env._step_kernel`, with one GPU thread per copy."""
+    i = cuda.grid(1)
+    if i < step_count.shape[0]:
+        step_count[i] += 1
+
+        # Update rewards
+        rewards[i] = 1.0
+
+        # Episode completion conditions
+        if step_count[i] % eps_end_timestep == 0:
+            terminations[i] = True
+
+
+@cuda.jit
+def reset_gpu(step_count, rewards, terminations, truncations, mask):
+    """Resets the state of the copies selected by `mask` on the GPU."""
+    i = cuda.grid(1)
+    if i < step_count.shape[0] and mask[i]:
+        step_count[i] = 0
+        rewards[i] = 0.0
+        terminations[i] = False
+        truncations[i] = False
+
+
+@cuda.jit
+def autoreset_gpu(step_count, rewards, terminations, truncations,
+                   rewards_out, terminations_out, truncations_out):
+    """Copies out the result of the last step, then resets the copies whose
+    episode ended, one GPU thread per copy."""
+    i = cuda.grid(1)
+    if i < step_count.shape[0]:
+        rewards_out[i] = rewards[i]
+        terminations_out[i] = terminations[i]
+        truncations_out[i] = truncations[i]
+
+        if terminations[i] or truncations[i]:
+            step_count[i] = 0
+            rewards[i] = 0.0
+            terminations[i] = False
+            truncations[i] = False
+
+
+@cuda.jit
+def fill_gpu(rng_states, pos, staff, staff_vec):
+    """Draws a fresh observation of every copy on the GPU, one thread and
+    one random stream per copy."""
+    i = cuda.grid(1)
+    if i < pos.shape[0]:
+        for j in range(pos.shape[1]):
+            pos[i, j] = xoroshiro128p_uniform_float32(rng_states, i)
+
+        for j in range(staff.shape[1]):
+            for k in range(staff.shape[2]):
+                staff[i, j, k] = xoroshiro128p_uniform_float32(rng_states, i)
+
+        for j in range(staff_vec.shape[1]):
+            for k in range(staff_vec.shape[2]):
+                staff_vec[i, j, k] = xoroshiro128p_uniform_float32(rng_states, i)
@@ -2,71 +2,115 @@
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 import numpy as np
 
 # Gynasium packages
-from gymnasium.spaces import Discrete, Box, Tuple
+from gymnasium.spaces import Discrete, Box, Dict
 
 @dataclass
 class ObsSpace:
-    """Observation space for the RLHR problem set."""
+    """Observation space for the RLHR problem set.
+
+    The spaces are built once per `max_action_space_size` and cached, the
+    same object being shared by every environment. Don't seed or otherwise
+    mutate them, deep-copy them first if a seeded space is needed.
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def create(max_action_space_size: int, dtype=np.float16) -> Dict:
+        """
+        Creates the full observation space of an agent, which consists of the
+        position and staff details together with the action mask.
+
+        Args:
+            max_action_space_size (int): The maximum size of the action space.
+            dtype (type): The dtype of every attribute. Defaults to np.float16.
+
+        Returns:
+            Dict: The observation space.
+        """
+        return Dict({
+            "observation": Dict({
+                "position_details": ObsSpace.create_pos_details(dtype=dtype),
+                "staff_details": ObsSpace.create_staff_details(max_staff_limit=max_action_space_size, dtype=dtype)
+            }),
+            "action_mask": Box(low=0, high=1, shape=(max_action_space_size, ), dtype=dtype)
+        })
 
     @staticmethod
-    def create_pos_details():
+    @lru_cache(maxsize=None)
+    def create_pos_details(dtype=np.float16):
         """
         Creates the observation space for the position attributes. You 
         may mix and match different data types together depending on your
         attributes but do take not of the dimensionality that will blow up
         as a result.
 
+        As every attribute shares the same bounds and dtype, they are stored
+        in a single flat `Box`, use `pos_details_slices` to index them.
+
+        Args:
+            dtype (type): The dtype of the attributes. Defaults to np.float16.
+
         Returns:
-            Tuple: A tuple of Box spaces representing the position attributes.
+            Box: A Box space representing the position attributes.
         """
+        return Box(low=0.0, high=1.0, shape=(97,), dtype=dtype)
 
-        # Position attributes
-        feat_1 = Box(low=0, high=1, dtype=np.float16)
-        feat_2 = Box(low=0, high=1, dtype=np.float16)
-        feat_3 = Box(low=0, high=1, dtype=np.float16)
-        feat_4 = Box(low=0, high=1, dtype=np.float16)
-        feat_5 = Box(low=0, high=1, dtype=np.float16)
-        feat_6 = Box(low=0, high=1, shape=(92,), dtype=np.float16)
+    @staticmethod
+    def pos_details_slices() -> dict:
+        """
+        Locates each position attribute within the flat position details.
 
-        return Tuple(
-            (feat_1, feat_2, feat_3, feat_4, feat_5, feat_6)
-        )
+        Returns:
+            dict: The index of attributes 1 to 5 and the slice of attribute 6.
+        """
+        return {
+            "feat_1": 0,
+            "feat_2": 1,
+            "feat_3": 2,
+            "feat_4": 3,
+            "feat_5": 4,
+            "feat_6": slice(5, 97)
+        }
 
     @staticmethod
-    def create_staff_details(max_staff_limit: int):
+    @lru_cache(maxsize=None)
+    def create_staff_details(max_staff_limit: int, dtype=np.float16):
         """
-        Creates the observation space for a staff member's details.
+        Creates the observation space for the staff members' details. The
+        attributes of every staff member are stored as rows of two contiguous
+        `Box` spaces rather than one nested `Tuple` per staff member, so the
+        whole space can be filled, and fed to a policy, as a single array.
 
         Args:
             max_staff_limit (int): The maximum number of staff members.
+            dtype (type): The dtype of the attributes. Defaults to np.float16.
 
         Returns:
-            Tuple: A tuple of Box spaces representing the staff member's details.
+            Dict: A dict of Box spaces representing the staff members' details,
+                  `scalars` holds attributes 1 to 5 and `vec` holds attribute 6.
         """
         # Staff attributes
-        attr_1 = Box(low=0, high=1, dtype=np.float16)
-        attr_2 = Box(low=0, high=1, dtype=np.float16)
-        attr_3 = Box(low=0, high=1, dtype=np.float16)
-        attr_4 = Box(low=0, high=1, dtype=np.float16)
-        attr_5 = Box(low=0, high=1, dtype=np.float16)
-        attr_6 = Box(low=0, high=1, shape=(4,), dtype=np.float16)
+        scalars = Box(low=0, high=1, shape=(max_staff_limit, 5), dtype=dtype)
+        vec = Box(low=0, high=1, shape=(max_staff_limit, 4), dtype=dtype)
 
-        return Tuple(
-            (
-                Tuple((attr_1, attr_2, attr_3, attr_4, attr_5, attr_6))
-                for _ in range(max_staff_limit)
-            )
-        )
+        return Dict({"scalars": scalars, "vec": vec})
 
 
 @dataclass
 class ActSpace:
-    """Action space for the RLHR problem set."""
+    """Action space for the RLHR problem set.
+
+    The action space is built once per `max_action_space_size` and cached,
+    the same object being shared by every environment. Don't seed it,
+    deep-copy it first if a seeded space is needed.
+    """
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def create(max_action_space_size: int) -> Discrete:
         """
         Creates the action space for the RLHR problem set. The action space is
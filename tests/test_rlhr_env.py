@@ -0,0 +1,49 @@
+"""Regression tests for copying the environments."""
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from rlhr_sim.simulator.simulate.rlhr_env import CustomEnv, CustomVectorEnv
+
+CLONES = {
+    "pickle": lambda env: pickle.loads(pickle.dumps(env)),
+    "deepcopy": copy.deepcopy,
+}
+
+
+@pytest.mark.parametrize("clone", CLONES.values(), ids=CLONES.keys())
+def test_vector_env_observations_refresh_after_copy(clone):
+    env = clone(CustomVectorEnv(max_action_space_size=10, eps_end_timestep=5, num_envs=2))
+
+    obs, _ = env.reset(seed=0)
+    first = copy.deepcopy(obs)
+    obs, *_ = env.step(np.zeros(2, dtype=np.int64))
+
+    assert not np.array_equal(
+        first["observation"]["position_details"],
+        obs["observation"]["position_details"]
+    )
+    assert not np.array_equal(
+        first["observation"]["staff_details"]["vec"],
+        obs["observation"]["staff_details"]["vec"]
+    )
+
+
+@pytest.mark.parametrize("clone", CLONES.values(), ids=CLONES.keys())
+def test_env_observations_refresh_after_copy(clone):
+    env = clone(CustomEnv(max_action_space_size=10, eps_end_timestep=5))
+    env.reset(seed=0)
+
+    first = copy.deepcopy(env.observe(env.agent_selection))
+    obs = env.observe(env.agent_selection)
+
+    assert not np.array_equal(
+        first["observation"]["position_details"],
+        obs["observation"]["position_details"]
+    )
+    assert not np.array_equal(
+        first["observation"]["staff_details"]["scalars"],
+        obs["observation"]["staff_details"]["scalars"]
+    )